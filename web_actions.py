@@ -1,16 +1,23 @@
 import atexit
+import functools
+import logging
+import sys
 import traceback
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import ElementClickInterceptedException, InvalidSelectorException
+from selenium.common.exceptions import ElementClickInterceptedException, ElementNotInteractableException, InvalidSelectorException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.remote.webelement import WebElement
 from enum import Enum
 from typing import List, Optional, Any, Dict, Union
 import re
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
 
 try:
     from tqdm import tqdm
@@ -18,6 +25,8 @@ try:
 except ImportError:
     tqdm_installed = False
 
+_TQDM = tqdm if tqdm_installed else None
+
 
 try:
     import undetected_chromedriver as uc
@@ -39,70 +48,515 @@ class SelectorType(Enum):
 
 
 
-def clean_traceback(tb: str) -> str:
+_BY_MAP: Dict[SelectorType, str] = {
+    SelectorType.XPATH: By.XPATH,
+    SelectorType.CSS: By.CSS_SELECTOR,
+    SelectorType.ID: By.ID,
+    SelectorType.NAME: By.NAME,
+    SelectorType.CLASS_NAME: By.CLASS_NAME,
+    SelectorType.TAG_NAME: By.TAG_NAME,
+    SelectorType.LINK_TEXT: By.LINK_TEXT,
+    SelectorType.PARTIAL_LINK_TEXT: By.PARTIAL_LINK_TEXT,
+}
+
+# Chrome command-line argument builders, by option value type. A None result means "don't add"
+_OPT_FORMATTERS = {
+    bool: lambda key, value: key if value else None,
+    str: lambda key, value: f"{key}={value}",
+    int: lambda key, value: f"{key}={value}",
+    float: lambda key, value: f"{key}={value}",
+}
+
+_FIND_SIMILAR_JS = """
+const el = arguments[0], criteria = arguments[1], matchAll = arguments[2], partial = arguments[3], customXpath = arguments[4], cssSelector = arguments[5];
+const parent = el.parentElement;
+if (!parent) return [];
+let found = [];
+if (customXpath) {
+    const snapshot = document.evaluate(customXpath, parent, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < snapshot.snapshotLength; i++) found.push(snapshot.snapshotItem(i));
+} else if (criteria === 'tag') {
+    found = parent.getElementsByTagName(el.tagName);
+} else if (criteria === 'class') {
+    const classes = [...el.classList].map(c => '.' + CSS.escape(c));
+    if (!classes.length) return [];
+    found = parent.querySelectorAll(matchAll ? classes.join('') : classes.join(','));
+} else if (criteria === 'css_selector') {
+    found = parent.querySelectorAll(cssSelector);
+} else {
+    const name = criteria.slice('attribute:'.length);
+    const value = el.getAttribute(name);
+    if (!value) return [];
+    found = parent.querySelectorAll('[' + CSS.escape(name) + (partial ? '*=' : '=') + '"' + CSS.escape(value) + '"]');
+}
+return [...new Set(found)].filter(n => n !== el);
+"""
+
+# Resolves a list of [name, selector type value, selector] queries against the document in one call
+_FIND_MULTI_JS = """
+const out = {};
+for (const [name, kind, sel] of arguments[0]) {
+    let found = null;
+    if (kind === 'xpath') {
+        found = document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } else if (kind === 'css selector') {
+        found = document.querySelector(sel);
+    } else if (kind === 'id') {
+        found = document.getElementById(sel);
+    } else if (kind === 'name') {
+        found = document.querySelector('[name="' + CSS.escape(sel) + '"]');
+    } else if (kind === 'class name') {
+        found = document.getElementsByClassName(sel)[0] || null;
+    } else if (kind === 'tag name') {
+        found = document.getElementsByTagName(sel)[0] || null;
+    } else {
+        // SVG <a> elements have no innerText
+        const text = a => a.innerText ?? a.textContent ?? '';
+        found = [...document.getElementsByTagName('a')].find(a => kind === 'link text' ? text(a).trim() === sel : text(a).includes(sel)) || null;
+    }
+    out[name] = found;
+}
+return out;
+"""
+
+# Shared by the scripts below: the text element.text would return. Unrendered nodes (head, script,
+# style, display:none...) have none, except options of a closed <select>, which have no layout box
+# but count as displayed when their <select> is. SVG and other non-HTML elements have no innerText
+_RENDERED_TEXT_JS = """
+const isRendered = e => e.getClientRects().length > 0 || (e.closest('select')?.getClientRects().length ?? 0) > 0;
+const renderedText = e => isRendered(e) ? (e.innerText ?? e.textContent ?? '').trim() : '';
+"""
+
+# Serializes an element and all of its descendants into a nested {tag, attrs, text, children} tree.
+# When arguments[1] is true the root node also carries its outerHTML.
+_SUBTREE_JS = _RENDERED_TEXT_JS + """
+function walk(el) {
+    return {
+        tag: el.tagName.toLowerCase(),
+        attrs: [...el.attributes].map(a => [a.name, a.value]),
+        text: renderedText(el),
+        children: [...el.children].map(walk)
+    };
+}
+const tree = walk(arguments[0]);
+if (arguments[1]) tree.html = arguments[0].outerHTML;
+return tree;
+"""
+
+# Absolute, index-qualified XPath of arguments[0], counting same-tag preceding siblings
+_XPATH_JS = """
+let e = arguments[0];
+const parts = [];
+while (e && e.nodeType === 1 && e.tagName.toLowerCase() !== 'html') {
+    let index = 1;
+    for (let s = e.previousElementSibling; s; s = s.previousElementSibling) {
+        if (s.tagName === e.tagName) index++;
+    }
+    parts.unshift(e.tagName.toLowerCase() + '[' + index + ']');
+    e = e.parentElement;
+}
+return '/html' + (parts.length ? '/' + parts.join('/') : '');
+"""
+
+# Full "tag#id > tag.class:nth-of-type(n)" selector path of arguments[0], from <html> down
+_CSS_SELECTOR_JS = """
+let e = arguments[0];
+const path = [];
+while (e) {
+    let sub = e.tagName.toLowerCase();
+    if (e.id) {
+        sub += '#' + CSS.escape(e.id);
+    } else if (e.getAttribute('class') && e.getAttribute('class').trim()) {
+        sub += '.' + e.getAttribute('class').trim().split(/\\s+/).map(c => CSS.escape(c)).join('.');
+    }
+    let index = 1;
+    for (let s = e.previousElementSibling; s; s = s.previousElementSibling) {
+        if (s.tagName === e.tagName) index++;
+    }
+    if (index > 1) sub += ':nth-of-type(' + index + ')';
+    path.unshift(sub);
+    e = e.parentElement;
+}
+return path.join(' > ');
+"""
+
+# Text plus any number of attributes of arguments[0], keyed like extract() ("__text__" for the text)
+_EXTRACT_MANY_JS = _RENDERED_TEXT_JS + """
+const e = arguments[0];
+const out = {__text__: renderedText(e)};
+for (const name of arguments[1]) out[name] = e.getAttribute(name);
+return out;
+"""
+
+# compare_elements() "class" and "text" checks, each done in a single call on arguments[0] and arguments[1]
+_SAME_CLASSES_JS = """
+const a = new Set(arguments[0].classList), b = new Set(arguments[1].classList);
+if (a.size !== b.size) return false;
+for (const c of a) if (!b.has(c)) return false;
+return true;
+"""
+_SAME_TEXT_JS = _RENDERED_TEXT_JS + "return renderedText(arguments[0]) === renderedText(arguments[1]);"
+
+# comprehensive_comparison() in one call: compares arguments[0] and arguments[1] step by step and
+# returns false at the first difference. arguments[2] holds the include/exclude lists (or null)
+_COMPREHENSIVE_COMPARE_JS = _RENDERED_TEXT_JS + """
+const [a, b, opts] = arguments;
+const asSet = list => list ? new Set(list) : null;
+const pick = (names, get, include, exclude) => {
+    const out = new Map();
+    for (const n of names) if ((!include || include.has(n)) && !(exclude && exclude.has(n))) out.set(n, get(n));
+    return out;
+};
+const same = (x, y) => x.size === y.size && [...x].every(([k, v]) => y.get(k) === v);
+if (a.tagName !== b.tagName) return false;
+const classesA = new Set(a.classList), classesB = new Set(b.classList);
+if (classesA.size !== classesB.size || [...classesA].some(c => !classesB.has(c))) return false;
+const incA = asSet(opts.include_attributes), excA = asSet(opts.exclude_attributes);
+const attrs = e => pick(e.getAttributeNames(), n => e.getAttribute(n), incA, excA);
+if (!same(attrs(a), attrs(b))) return false;
+if (renderedText(a) !== renderedText(b)) return false;
+if (opts.compare_css) {
+    const incC = asSet(opts.include_css_properties), excC = asSet(opts.exclude_css_properties);
+    const styles = e => {
+        const s = getComputedStyle(e);
+        return pick(Array.from(s), n => s.getPropertyValue(n), incC, excC);
+    };
+    if (!same(styles(a), styles(b))) return false;
+}
+return true;
+"""
+
+_COUNT_CSS_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+_PAGE_INFO_JS = "return {title: document.title, url: location.href};"
+# Serializes the whole document, doctype included, the same way ChromeDriver builds driver.page_source
+_PAGE_INFO_WITH_SOURCE_JS = "return {title: document.title, url: location.href, source: new XMLSerializer().serializeToString(document)};"
+
+# scroll() scripts keyed by (direction, target, to_end). The scripts are constant strings:
+# the element or scroll amount is always passed in as arguments[0], never formatted into the source
+_SCROLL_TO_JS = "window.scrollTo(arguments[0], arguments[1]);"
+_SCROLL_SCRIPTS = {
+    ("down", "amount", False): "window.scrollBy(0, arguments[0]);",
+    ("up", "amount", False): "window.scrollBy(0, -arguments[0]);",
+    ("down", "element", False): "arguments[0].scrollIntoView();",
+    ("down", "element", True): "arguments[0].scrollIntoView(false);",
+    ("up", "element", False): "arguments[0].scrollIntoView();",
+    ("up", "element", True): "arguments[0].scrollIntoView(true);",
+    ("to_element", "element", False): "arguments[0].scrollIntoView();",
+    ("down", "page", False): "window.scrollTo(0, document.body.scrollHeight);",
+    ("up", "page", False): "window.scrollTo(0, 0);",
+}
+
+# Clicks dispatched from JavaScript: no coordinate calculation and no interception checks
+_JS_CLICK = "arguments[0].click(); return true;"
+_JS_CLICK_MANY = "for (const e of arguments[0]) e.click(); return arguments[0].length;"
+
+# Entries kept in each of the per-session caches (elements, lookups, waits, CSS selectors and XPaths)
+_SELECTOR_CACHE_SIZE = 1024
+
+# Sets every attribute in arguments[1] on arguments[0], then its text unless arguments[2] is null
+_MODIFY_ELEMENT_JS = """
+const e = arguments[0], attrs = arguments[1], text = arguments[2];
+for (const name in attrs) e.setAttribute(name, attrs[name]);
+if (text !== null) e.textContent = text;
+"""
+
+_STACK_FRAME_RE = re.compile(r"#\d+\s0x[0-9a-fA-F]+")
+_CLASS_SPLIT = re.compile(r'\S+')
+# key="value" (quoted) or key=value (unquoted) pairs of find_elements_by_attributes()
+_ATTR_PAIR_RE = re.compile(r'([^\s="]+)\s*=\s*(?:"([^"]*)"|([^\s"]*))')
+# Characters convert_css_selector() escapes. The combinators > + ~ are left out so they survive as structure
+_CSS_SPECIAL_RE = re.compile(r'([!"#$%&\'()*,\/:;<=?@[\\\]^`{|}])')
+
+
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>DOM Structure Visualization</title>
+    <style>
+        body { font-family: Arial, sans-serif; }
+        .element { margin-left: 20px; position: relative; }
+        .tag { color: blue; cursor: pointer; }
+        .tag:hover { text-decoration: underline; }
+        .attributes { color: red; }
+        .text { color: green; }
+        .hidden { display: none; }
+        .highlight { background-color: yellow; }
+        .code-container { border-bottom: 1px solid #ccc; padding-bottom: 10px; }
+        .real-dom-container { padding: 20px; border: 1px solid #ccc; margin-top: 20px; }
+        .selectors { position: absolute; right: 0; top: 0; }
+        .selectors button { margin-left: 5px; }
+        .children { margin-left: 20px; }
+        .toggle { cursor: pointer; font-weight: bold; }
+        .divider { border-top: 1px solid #ccc; margin: 10px 0; }
+        .search-bar { margin-bottom: 20px; }
+    </style>
+    <script>
+        function copyToClipboard(text) {
+            navigator.clipboard.writeText(text).then(() => {
+                alert('Copied to clipboard: ' + text);
+            }, (err) => {
+                console.error('Could not copy text: ', err);
+            });
+        }
+
+        function copyCssSelector(elementId) {
+            const element = document.getElementById(elementId);
+            const classList = element.getAttribute('data-attributes').match(/class="([^"]*)"/);
+            if (classList) {
+                const cssSelector = '.' + classList[1].split(' ').join('.');
+                copyToClipboard(cssSelector);
+            } else {
+                alert('No class attribute found.');
+            }
+        }
+
+        function copyAttributes(elementId) {
+            const element = document.getElementById(elementId);
+            const attributes = element.getAttribute('data-attributes');
+            copyToClipboard(attributes);
+        }
+
+        function toggleVisibility(childrenId, dividerId, toggleElement) {
+            const children = document.getElementById(childrenId);
+            const divider = document.getElementById(dividerId);
+            if (children && divider) {
+                if (children.style.display === 'none') {
+                    children.style.display = 'block';
+                    divider.style.display = 'block';
+                    toggleElement.innerHTML = '&#9660;';
+                } else {
+                    children.style.display = 'none';
+                    divider.style.display = 'none';
+                    toggleElement.innerHTML = '&#9654;';
+                }
+            } else {
+                console.error('Children or divider not found for IDs:', childrenId, dividerId);
+            }
+        }
+
+        function filterElements() {
+            const searchTerm = document.getElementById('search-input').value.toLowerCase();
+            document.querySelectorAll('.element').forEach(element => {
+                const text = element.getAttribute('data-text').toLowerCase();
+                const tag = element.getAttribute('data-tag').toLowerCase();
+                const attributes = element.getAttribute('data-attributes').toLowerCase();
+                if (text.includes(searchTerm) || tag.includes(searchTerm) || attributes.includes(searchTerm)) {
+                    element.style.display = 'block';
+                } else {
+                    element.style.display = 'none';
+                }
+            });
+        }
+
+        document.addEventListener('DOMContentLoaded', () => {
+            document.querySelectorAll('.tag').forEach(tag => {
+                tag.addEventListener('mouseover', () => {
+                    const elementId = tag.parentElement.id;
+                    const realElement = document.querySelector(`[data-element-id='${elementId}']`);
+                    if (realElement) {
+                        realElement.classList.add('highlight');
+                    }
+                });
+                tag.addEventListener('mouseout', () => {
+                    const elementId = tag.parentElement.id;
+                    const realElement = document.querySelector(`[data-element-id='${elementId}']`);
+                    if (realElement) {
+                        realElement.classList.remove('highlight');
+                    }
+                });
+            });
+        });
+    </script>
+</head>
+<body>
+    <h1>DOM Structure Visualization</h1>
+    <div class="search-bar">
+        <input type="text" id="search-input" onkeyup="filterElements()" placeholder="Search for elements...">
+    </div>
+    <div class="code-container">"""
+
+_HTML_FOOTER = """</div>
+</body>
+</html>
+"""
+
+# Per-node markup for generate_structure_html, filled in with str.format for each node
+_NODE_OPEN_TMPL = """
+{indent}<div class='element' id='{eid}' data-tag='{tag}' data-attributes='{attrs}' data-text='{text}'>
+    <span class='toggle' onclick="toggleVisibility('{eid}-children', '{eid}-divider', this)">&#9660;</span>
+    <span class='tag'>&lt;{tag} {attrs}&gt;</span> {text}
+    <div class='selectors'>
+        <button onclick="copyCssSelector('{eid}')">Copy CSS Selector</button>
+        <button onclick="copyAttributes('{eid}')">Copy Attributes</button>
+    </div>
+    <div id='{eid}-children' class='children'>
+"""
+
+_NODE_CLOSE_TMPL = """{indent}</div>
+{indent}&lt;/{tag}&gt;</div><hr class='divider' id='{eid}-divider'>"""
+
+
+def css_escape(value: str) -> str:
     """
-    Clean the traceback by removing unhelpful parts and add a divider.
+    Escape a string for use as a CSS identifier, mirroring the browser's CSS.escape().
     
     Args:
-        tb (str): The original traceback string.
+        value (str): The raw identifier (class name, id, attribute name...).
     
     Returns:
-        str: The cleaned traceback string.
+        str: The escaped identifier.
+    """
+    escaped = []
+    for index, char in enumerate(value):
+        code = ord(char)
+        if code == 0:
+            escaped.append("\ufffd")
+        elif 0x01 <= code <= 0x1F or code == 0x7F or (char.isdigit() and char.isascii() and (index == 0 or (index == 1 and value[0] == "-"))):
+            escaped.append(f"\\{code:x} ")
+        elif index == 0 and char == "-" and len(value) == 1:
+            escaped.append("\\-")
+        elif code >= 0x80 or char in "-_" or (char.isascii() and char.isalnum()):
+            escaped.append(char)
+        else:
+            escaped.append("\\" + char)
+    return "".join(escaped)
+
+
+def _lru_get(cache: OrderedDict, key: Any) -> Any:
+    """
+    Look up a key in a bounded LRU cache, marking it as recently used.
+    
+    Args:
+        cache (OrderedDict): The cache, least recently used entry first.
+        key (Any): The key to look up.
+    
+    Returns:
+        Any: The cached value, or None if the key is not cached.
     """
-    lines = tb.splitlines()
-    cleaned_lines = ["-----------------------"]
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict, key: Any, value: Any) -> Any:
+    """
+    Store a value in a bounded LRU cache, evicting the least recently used entry once it is full.
+    
+    Args:
+        cache (OrderedDict): The cache, least recently used entry first.
+        key (Any): The key to store under.
+        value (Any): The value to store.
+    
+    Returns:
+        Any: The stored value.
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _SELECTOR_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def _iter_cleaned_traceback(tb: str):
+    """
+    Yield the lines of a traceback with a leading divider, skipping driver stacktrace frames.
+    
+    Args:
+        tb (str): The original traceback string.
+    
+    Yields:
+        str: The lines to keep.
+    """
+    yield "-----------------------"
     stacktrace_found = False
 
-    for line in lines:
+    for line in tb.splitlines():
         if stacktrace_found:
-            if re.match(r"#\d+\s0x[0-9a-fA-F]+", line.strip()):
+            stripped = line.lstrip()
+            # Cheap prefix check first; only frame-looking lines go through the regex
+            if stripped.startswith("#") and _STACK_FRAME_RE.match(stripped):
                 continue
             else:
                 stacktrace_found = False  # Stop skipping lines once we encounter a non-matching line
         if "Stacktrace:" in line:
             stacktrace_found = True
             continue  # Skip the "Stacktrace:" line itself
-        cleaned_lines.append(line)
+        yield line
 
-    return "\n".join(cleaned_lines)
+def clean_traceback(tb: str) -> str:
+    """
+    Clean the traceback by removing unhelpful parts and add a divider.
+    
+    Args:
+        tb (str): The original traceback string.
+    
+    Returns:
+        str: The cleaned traceback string.
+    """
+    return "\n".join(_iter_cleaned_traceback(tb))
 
 def format_deeper_traceback() -> str:
     """
-    Format a deeper traceback by combining the current stack trace with the exception traceback.
+    Format the traceback of the exception currently being handled.
+    Only call this once the traceback is actually going to be printed.
     
     Returns:
-        str: The formatted deeper traceback string.
+        str: The formatted traceback string.
     """
-    current_stack = traceback.format_stack()[:-1]  # Exclude the current function call
-    exception_traceback = traceback.format_exc().splitlines()
-    combined_traceback = current_stack + exception_traceback
-    return "\n".join(combined_traceback)
+    return "".join(traceback.TracebackException(*sys.exc_info()).format())
 
 class WebSession:
-    def __init__(self, options: Optional[Dict[str, Any]] = None, use_undetected: bool = False) -> None:
+    __slots__ = ("driver", "_find_cache", "cache_elements", "_elem_cache", "poll_interval", "_waits", "_actions", "_css_selector_cache", "_xpath_cache", "_page_load_strategy", "_implicit_wait")
+
+    def __init__(self, options: Optional[Dict[str, Any]] = None, use_undetected: bool = False, cache_elements: bool = False, poll_interval: float = 0.1) -> None:
         """
         Initialize the WebSession.
         
         Args:
             options (dict): A dictionary of options to configure the browser.
             use_undetected (bool): Whether to use undetected ChromeDriver.
+            cache_elements (bool): Whether to cache elements returned by find_element and reuse them for repeated lookups.
+            poll_interval (float): How often, in seconds, explicit waits re-check their condition.
         """
         chrome_options = webdriver.ChromeOptions()
         if options:
             for key, value in options.items():
                 # Ensure the key is prefixed with '--'
                 prefixed_key = key if key.startswith("--") else f"--{key}"
-                
-                if isinstance(value, bool) and value:
-                    chrome_options.add_argument(prefixed_key)
-                elif isinstance(value, str):
-                    chrome_options.add_argument(f"{prefixed_key}={value}")
-                # Add more specific handling as needed
+
+                formatter = _OPT_FORMATTERS.get(type(value))
+                argument = formatter(prefixed_key, value) if formatter else None
+                if argument:
+                    chrome_options.add_argument(argument)
 
         if use_undetected and uc_installed:
             self.driver = uc.Chrome(options=chrome_options)
         else:
             self.driver = webdriver.Chrome(options=chrome_options)
+
+        # Short-lived cache of find_elements_cached results, keyed by (selector_type, selector)
+        self._find_cache: OrderedDict[tuple, tuple] = OrderedDict()
+        # Elements returned by find_element, keyed by (selector_type, selector, parent element id)
+        self.cache_elements = cache_elements
+        self._elem_cache: OrderedDict[tuple, WebElement] = OrderedDict()
+        # Explicit waits, reused per (search context, timeout)
+        self.poll_interval = poll_interval
+        self._waits: OrderedDict[tuple, WebDriverWait] = OrderedDict()
+        # All three are LRUs capped at _SELECTOR_CACHE_SIZE entries, like the selector caches below
+        # Implicit wait currently configured on the driver; only changed through set_implicit_wait
+        self._implicit_wait = 0
+        # With the "normal" strategy driver.get() only returns once the document is complete
+        self._page_load_strategy = self.driver.capabilities.get("pageLoadStrategy", "normal")
+        # Generated CSS selectors and XPaths, keyed by the element's remote id, least recently used first
+        self._css_selector_cache: OrderedDict[str, str] = OrderedDict()
+        self._xpath_cache: OrderedDict[str, str] = OrderedDict()
+        # Shared action chain builder for mouse and keyboard interactions
+        self._actions = ActionChains(self.driver)
         
         atexit.register(self.close)
 
@@ -130,6 +584,7 @@ class WebSession:
         """
         print("Debug mode: Browser is open and waiting indefinitely.")
         try:
+            # A short sleep loop rather than one untimed wait, which Ctrl+C can't interrupt on Windows
             while True:
                 time.sleep(1)
         except KeyboardInterrupt:
@@ -137,6 +592,27 @@ class WebSession:
         finally:
             self.close()
 
+    def _by(self, selector_type: SelectorType) -> str:
+        """
+        Map a SelectorType to the matching Selenium By strategy.
+        
+        Args:
+            selector_type (SelectorType): The type of selector.
+        
+        Returns:
+            str: The Selenium By strategy string.
+        """
+        by = _BY_MAP.get(selector_type)
+        if by is None:
+            raise ValueError(f"Unsupported selector type: {selector_type}")
+        return by
+
+    def _context(self, element: Optional[WebElement]) -> Union[webdriver.Remote, WebElement]:
+        """
+        Return the search context for a lookup: the given element, or the driver if none is given.
+        """
+        return element if element else self.driver
+
     def wait_for_element(self, selector_type: SelectorType, selector: str, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> Optional[WebElement]:
         """
         Wait for an element to be present in the DOM.
@@ -152,18 +628,11 @@ class WebSession:
             WebElement: The found element, or None if not found.
         """
         try:
-            if selector_type == SelectorType.XPATH:
-                return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((By.XPATH, selector)))
-            elif selector_type == SelectorType.CSS:
-                return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-            else:
-                raise ValueError(f"Unsupported selector type: {selector_type}")
+            return self._wait_until(self.driver, timeout, EC.presence_of_element_located((self._by(selector_type), selector)))
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return None
 
     def wait_for_elements(self, selector_type: SelectorType, selector: str, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> List[WebElement]:
@@ -181,18 +650,11 @@ class WebSession:
             list: A list of found elements, or an empty list if none are found.
         """
         try:
-            if selector_type == SelectorType.XPATH:
-                return WebDriverWait(self.driver, timeout).until(EC.presence_of_all_elements_located((By.XPATH, selector)))
-            elif selector_type == SelectorType.CSS:
-                return WebDriverWait(self.driver, timeout).until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
-            else:
-                raise ValueError(f"Unsupported selector type: {selector_type}")
+            return self._wait_until(self.driver, timeout, EC.presence_of_all_elements_located((self._by(selector_type), selector)))
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return []
 
 
@@ -212,92 +674,24 @@ class WebSession:
             WebElement: The found element, or None if not found.
         """
         try:
-            if element:
-                if timeout:
-                    wait = WebDriverWait(element, timeout)
-                    if selector_type == SelectorType.XPATH:
-                        return wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                    elif selector_type == SelectorType.CSS:
-                        return wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    elif selector_type == SelectorType.ID:
-                        return wait.until(EC.presence_of_element_located((By.ID, selector)))
-                    elif selector_type == SelectorType.NAME:
-                        return wait.until(EC.presence_of_element_located((By.NAME, selector)))
-                    elif selector_type == SelectorType.CLASS_NAME:
-                        return wait.until(EC.presence_of_element_located((By.CLASS_NAME, selector)))
-                    elif selector_type == SelectorType.TAG_NAME:
-                        return wait.until(EC.presence_of_element_located((By.TAG_NAME, selector)))
-                    elif selector_type == SelectorType.LINK_TEXT:
-                        return wait.until(EC.presence_of_element_located((By.LINK_TEXT, selector)))
-                    elif selector_type == SelectorType.PARTIAL_LINK_TEXT:
-                        return wait.until(EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, selector)))
-                    else:
-                        raise ValueError(f"Unsupported selector type: {selector_type}")
-                else:
-                    if selector_type == SelectorType.XPATH:
-                        return element.find_element(By.XPATH, selector)
-                    elif selector_type == SelectorType.CSS:
-                        return element.find_element(By.CSS_SELECTOR, selector)
-                    elif selector_type == SelectorType.ID:
-                        return element.find_element(By.ID, selector)
-                    elif selector_type == SelectorType.NAME:
-                        return element.find_element(By.NAME, selector)
-                    elif selector_type == SelectorType.CLASS_NAME:
-                        return element.find_element(By.CLASS_NAME, selector)
-                    elif selector_type == SelectorType.TAG_NAME:
-                        return element.find_element(By.TAG_NAME, selector)
-                    elif selector_type == SelectorType.LINK_TEXT:
-                        return element.find_element(By.LINK_TEXT, selector)
-                    elif selector_type == SelectorType.PARTIAL_LINK_TEXT:
-                        return element.find_element(By.PARTIAL_LINK_TEXT, selector)
-                    else:
-                        raise ValueError(f"Unsupported selector type: {selector_type}")
+            by = self._by(selector_type)
+            if self.cache_elements:
+                key = (selector_type, selector, element.id if element else None)
+                cached = _lru_get(self._elem_cache, key)
+                if cached is not None:
+                    return cached
+            context = self._context(element)
+            if timeout:
+                found = self._wait_until(context, timeout, EC.presence_of_element_located((by, selector)))
             else:
-                if timeout:
-                    wait = WebDriverWait(self.driver, timeout)
-                    if selector_type == SelectorType.XPATH:
-                        return wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                    elif selector_type == SelectorType.CSS:
-                        return wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    elif selector_type == SelectorType.ID:
-                        return wait.until(EC.presence_of_element_located((By.ID, selector)))
-                    elif selector_type == SelectorType.NAME:
-                        return wait.until(EC.presence_of_element_located((By.NAME, selector)))
-                    elif selector_type == SelectorType.CLASS_NAME:
-                        return wait.until(EC.presence_of_element_located((By.CLASS_NAME, selector)))
-                    elif selector_type == SelectorType.TAG_NAME:
-                        return wait.until(EC.presence_of_element_located((By.TAG_NAME, selector)))
-                    elif selector_type == SelectorType.LINK_TEXT:
-                        return wait.until(EC.presence_of_element_located((By.LINK_TEXT, selector)))
-                    elif selector_type == SelectorType.PARTIAL_LINK_TEXT:
-                        return wait.until(EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, selector)))
-                    else:
-                        raise ValueError(f"Unsupported selector type: {selector_type}")
-                else:
-                    if selector_type == SelectorType.XPATH:
-                        return self.driver.find_element(By.XPATH, selector)
-                    elif selector_type == SelectorType.CSS:
-                        return self.driver.find_element(By.CSS_SELECTOR, selector)
-                    elif selector_type == SelectorType.ID:
-                        return self.driver.find_element(By.ID, selector)
-                    elif selector_type == SelectorType.NAME:
-                        return self.driver.find_element(By.NAME, selector)
-                    elif selector_type == SelectorType.CLASS_NAME:
-                        return self.driver.find_element(By.CLASS_NAME, selector)
-                    elif selector_type == SelectorType.TAG_NAME:
-                        return self.driver.find_element(By.TAG_NAME, selector)
-                    elif selector_type == SelectorType.LINK_TEXT:
-                        return self.driver.find_element(By.LINK_TEXT, selector)
-                    elif selector_type == SelectorType.PARTIAL_LINK_TEXT:
-                        return self.driver.find_element(By.PARTIAL_LINK_TEXT, selector)
-                    else:
-                        raise ValueError(f"Unsupported selector type: {selector_type}")
+                found = context.find_element(by, selector)
+            if self.cache_elements:
+                _lru_put(self._elem_cache, key, found)
+            return found
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return None
 
 
@@ -318,95 +712,222 @@ class WebSession:
             list: A list of found elements, or an empty list if none are found.
         """
         try:
-            if element:
-                if timeout:
-                    wait = WebDriverWait(element, timeout)
-                    if selector_type == SelectorType.XPATH:
-                        return wait.until(EC.presence_of_all_elements_located((By.XPATH, selector)))
-                    elif selector_type == SelectorType.CSS:
-                        return wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
-                    elif selector_type == SelectorType.ID:
-                        return wait.until(EC.presence_of_all_elements_located((By.ID, selector)))
-                    elif selector_type == SelectorType.NAME:
-                        return wait.until(EC.presence_of_all_elements_located((By.NAME, selector)))
-                    elif selector_type == SelectorType.CLASS_NAME:
-                        return wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, selector)))
-                    elif selector_type == SelectorType.TAG_NAME:
-                        return wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, selector)))
-                    elif selector_type == SelectorType.LINK_TEXT:
-                        return wait.until(EC.presence_of_all_elements_located((By.LINK_TEXT, selector)))
-                    elif selector_type == SelectorType.PARTIAL_LINK_TEXT:
-                        return wait.until(EC.presence_of_all_elements_located((By.PARTIAL_LINK_TEXT, selector)))
-                    else:
-                        raise ValueError(f"Unsupported selector type: {selector_type}")
-                else:
-                    if selector_type == SelectorType.XPATH:
-                        return element.find_elements(By.XPATH, selector)
-                    elif selector_type == SelectorType.CSS:
-                        return element.find_elements(By.CSS_SELECTOR, selector)
-                    elif selector_type == SelectorType.ID:
-                        return element.find_elements(By.ID, selector)
-                    elif selector_type == SelectorType.NAME:
-                        return element.find_elements(By.NAME, selector)
-                    elif selector_type == SelectorType.CLASS_NAME:
-                        return element.find_elements(By.CLASS_NAME, selector)
-                    elif selector_type == SelectorType.TAG_NAME:
-                        return element.find_elements(By.TAG_NAME, selector)
-                    elif selector_type == SelectorType.LINK_TEXT:
-                        return element.find_elements(By.LINK_TEXT, selector)
-                    elif selector_type == SelectorType.PARTIAL_LINK_TEXT:
-                        return element.find_elements(By.PARTIAL_LINK_TEXT, selector)
-                    else:
-                        raise ValueError(f"Unsupported selector type: {selector_type}")
-            else:
-                if timeout:
-                    wait = WebDriverWait(self.driver, timeout)
-                    if selector_type == SelectorType.XPATH:
-                        return wait.until(EC.presence_of_all_elements_located((By.XPATH, selector)))
-                    elif selector_type == SelectorType.CSS:
-                        return wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
-                    elif selector_type == SelectorType.ID:
-                        return wait.until(EC.presence_of_all_elements_located((By.ID, selector)))
-                    elif selector_type == SelectorType.NAME:
-                        return wait.until(EC.presence_of_all_elements_located((By.NAME, selector)))
-                    elif selector_type == SelectorType.CLASS_NAME:
-                        return wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, selector)))
-                    elif selector_type == SelectorType.TAG_NAME:
-                        return wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, selector)))
-                    elif selector_type == SelectorType.LINK_TEXT:
-                        return wait.until(EC.presence_of_all_elements_located((By.LINK_TEXT, selector)))
-                    elif selector_type == SelectorType.PARTIAL_LINK_TEXT:
-                        return wait.until(EC.presence_of_all_elements_located((By.PARTIAL_LINK_TEXT, selector)))
-                    else:
-                        raise ValueError(f"Unsupported selector type: {selector_type}")
-                else:
-                    if selector_type == SelectorType.XPATH:
-                        return self.driver.find_elements(By.XPATH, selector)
-                    elif selector_type == SelectorType.CSS:
-                        return self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    elif selector_type == SelectorType.ID:
-                        return self.driver.find_elements(By.ID, selector)
-                    elif selector_type == SelectorType.NAME:
-                        return self.driver.find_elements(By.NAME, selector)
-                    elif selector_type == SelectorType.CLASS_NAME:
-                        return self.driver.find_elements(By.CLASS_NAME, selector)
-                    elif selector_type == SelectorType.TAG_NAME:
-                        return self.driver.find_elements(By.TAG_NAME, selector)
-                    elif selector_type == SelectorType.LINK_TEXT:
-                        return self.driver.find_elements(By.LINK_TEXT, selector)
-                    elif selector_type == SelectorType.PARTIAL_LINK_TEXT:
-                        return self.driver.find_elements(By.PARTIAL_LINK_TEXT, selector)
-                    else:
-                        raise ValueError(f"Unsupported selector type: {selector_type}")
+            by = self._by(selector_type)
+            context = self._context(element)
+            if timeout:
+                return self._wait_until(context, timeout, EC.presence_of_all_elements_located((by, selector)))
+            return context.find_elements(by, selector)
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return []
 
 
+    def find_elements_cached(self, selector_type: SelectorType, selector: str, ttl: float = 0.5, suppress_traceback: bool = False, raise_exc: bool = False) -> List[WebElement]:
+        """
+        Find elements, reusing the result of an identical lookup made within the last `ttl` seconds.
+        The cache is cleared whenever the session navigates.
+        
+        Args:
+            selector_type (SelectorType): The type of selector (XPATH, CSS, ID, NAME, CLASS_NAME, TAG_NAME, LINK_TEXT, PARTIAL_LINK_TEXT).
+            selector (str): The selector string.
+            ttl (float): How long, in seconds, a cached result stays valid.
+            suppress_traceback (bool): Whether to suppress the traceback print.
+            raise_exc (bool): Whether to re-raise the exception.
+        
+        Returns:
+            list: A list of found elements, or an empty list if none are found.
+        """
+        key = (selector_type, selector)
+        cached = _lru_get(self._find_cache, key)
+        now = time.monotonic()
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        elements = self.find_elements(selector_type, selector, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
+        _lru_put(self._find_cache, key, (now, elements))
+        return elements
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop all cached element lookups. Call this after anything that replaces the page content.
+        """
+        self._find_cache.clear()
+        self._elem_cache.clear()
+        self._css_selector_cache.clear()
+        self._xpath_cache.clear()
+
+    def find_elements_multi(self, queries: List[tuple], suppress_traceback: bool = False, raise_exc: bool = False) -> Dict[str, Optional[WebElement]]:
+        """
+        Find several elements at once, resolving all of them in a single browser round trip.
+        
+        Args:
+            queries (list): A list of (name, selector_type, selector) tuples.
+            suppress_traceback (bool): Whether to suppress the traceback print.
+            raise_exc (bool): Whether to re-raise the exception.
+        
+        Returns:
+            dict: A mapping of each query name to the first matching element, or None if nothing matched.
+                  Returns an empty dict if the lookup fails.
+        
+        Example:
+            fields = session.find_elements_multi([
+                ("username", SelectorType.ID, "user"),
+                ("password", SelectorType.NAME, "pass"),
+                ("submit", SelectorType.CSS, "button[type=submit]"),
+            ])
+        """
+        try:
+            payload = [[name, selector_type.value, selector] for name, selector_type, selector in queries]
+            return self.driver.execute_script(_FIND_MULTI_JS, payload)
+        except Exception:
+            if raise_exc:
+                raise
+            self._log_error(suppress_traceback)
+            return {}
+
+    def _on_navigation(self) -> None:
+        """
+        Drop any state that is only valid for the current page.
+        """
+        self.invalidate_cache()
+        self._waits.clear()
+
+    def set_implicit_wait(self, seconds: float) -> None:
+        """
+        Set the driver's implicit wait. Use this instead of driver.implicitly_wait so the session
+        can switch it off around its own explicit waits.
+        
+        Args:
+            seconds (float): The implicit wait, in seconds.
+        """
+        self.driver.implicitly_wait(seconds)
+        self._implicit_wait = seconds
+
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Temporarily disable the implicit wait. Otherwise every poll of an explicit wait can block
+        for the full implicit timeout. Does nothing (and costs no round trips) when no implicit wait is set.
+        """
+        previous = self._implicit_wait
+        if not previous:
+            yield
+            return
+        self.driver.implicitly_wait(0)
+        self._implicit_wait = 0
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(previous)
+            self._implicit_wait = previous
+
+    def _wait_until(self, context: Union[webdriver.Remote, WebElement], timeout: float, condition) -> Any:
+        """
+        Run an explicit wait with the implicit wait switched off.
+        
+        Args:
+            context (WebDriver or WebElement): The driver or element to wait on.
+            timeout (float): The maximum time to wait.
+            condition (callable): The expected condition.
+        
+        Returns:
+            Any: The value returned by the condition.
+        """
+        with self._no_implicit_wait():
+            return self._get_wait(context, timeout).until(condition)
+
+    def _get_wait(self, context: Union[webdriver.Remote, WebElement], timeout: float) -> WebDriverWait:
+        """
+        Get a cached WebDriverWait for the given search context and timeout.
+        
+        Args:
+            context (WebDriver or WebElement): The driver or element to wait on.
+            timeout (float): The maximum time to wait.
+        
+        Returns:
+            WebDriverWait: The wait object.
+        """
+        key = (context.id if isinstance(context, WebElement) else id(context), timeout)
+        wait = _lru_get(self._waits, key)
+        if wait is None:
+            wait = _lru_put(self._waits, key, WebDriverWait(context, timeout, poll_frequency=self.poll_interval, ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)))
+        return wait
+
+    def _resolve_element(self, selector_type: SelectorType, selector: str, *, element: Optional[WebElement] = None, wait: bool = True, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> Optional[WebElement]:
+        """
+        Look up the element an action method operates on, waiting for it to be present unless told not to.
+        
+        Args:
+            selector_type (SelectorType): The type of selector.
+            selector (str): The selector string.
+            element (WebElement): The element to search within, or None to search the whole page.
+            wait (bool): Whether to wait up to `timeout` seconds for the element to appear.
+            timeout (int): The maximum time to wait for the element.
+            suppress_traceback (bool): Whether to suppress the traceback print.
+            raise_exc (bool): Whether to re-raise the exception.
+        
+        Returns:
+            WebElement: The found element, or None if not found.
+        """
+        # find_element with a timeout is the same presence wait as wait_for_element, but also
+        # supports every selector type and goes through the element cache
+        return self.find_element(selector_type, selector, element, suppress_traceback=suppress_traceback, raise_exc=raise_exc, timeout=timeout if wait else None)
+
+    def _perform_actions(self, build) -> None:
+        """
+        Build and perform an action chain on the shared ActionChains instance.
+        perform() already empties the queued actions, so the instance is reused without
+        calling reset_actions(), which would cost an extra round trip to the driver.
+        
+        Args:
+            build (callable): A function that takes the ActionChains and returns it with actions queued.
+        """
+        try:
+            build(self._actions).perform()
+        except Exception:
+            # Drop anything left queued locally so the next chain starts clean
+            for device in self._actions.w3c_actions.devices:
+                device.clear_actions()
+            raise
+
+    def _log_error(self, suppress_traceback: bool, message: Optional[str] = None) -> None:
+        """
+        Print the cleaned traceback of the exception being handled, and an optional summary line.
+        
+        Args:
+            suppress_traceback (bool): Whether to skip printing entirely.
+            message (Optional[str]): Summary printed as "<message>: <exception>" after the traceback.
+        """
+        if suppress_traceback:
+            return
+        print(clean_traceback(format_deeper_traceback()))
+        if message:
+            print(f"{message}: {sys.exc_info()[1]}")
+
+    def _use_element(self, selector_type: Optional[SelectorType], selector: Optional[str], element: WebElement, action, parent: Optional[WebElement] = None) -> Any:
+        """
+        Apply an action to an element, re-finding it once if a cached reference has gone stale.
+        
+        Args:
+            selector_type (SelectorType): The selector type the element was found with, or None if it was passed in directly.
+            selector (str): The selector string the element was found with.
+            element (WebElement): The element to act on.
+            action (callable): A function taking the element.
+            parent (WebElement): The element the selector was searched within, if any.
+        
+        Returns:
+            Any: The return value of the action.
+        """
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            if not self.cache_elements or not selector_type or not selector:
+                raise
+            self._elem_cache.pop((selector_type, selector, parent.id if parent else None), None)
+            return action(self.find_element(selector_type, selector, parent, raise_exc=True))
+
+
     def find_similar_elements(self, element: WebElement, similarity_criteria: str = "class", match_all_classes: bool = False, partial_match: bool = False, custom_xpath: Optional[str] = None, suppress_traceback: bool = False, reraise_exception: bool = False) -> List[WebElement]:
         """
         Find similar elements in the DOM based on a given element and similarity criteria.
@@ -427,62 +948,23 @@ class WebSession:
             if not element:
                 raise ValueError("Element must be provided.")
             
-            # Find the parent container that holds all similar elements
-            parent = element.find_element(By.XPATH, "..")
-            
-            if custom_xpath:
-                similar_elements = parent.find_elements(By.XPATH, custom_xpath)
-            elif similarity_criteria == "tag":
-                similar_elements = parent.find_elements(By.XPATH, f".//{element.tag_name}")
-            elif similarity_criteria == "class":
-                class_names = element.get_attribute("class").split()
-                if not class_names:
-                    return []
-                if match_all_classes:
-                    class_condition = " and ".join([f"contains(@class, '{cls}')" for cls in class_names])
-                else:
-                    class_condition = " or ".join([f"contains(@class, '{cls}')" for cls in class_names])
-                similar_elements = parent.find_elements(By.XPATH, f".//*[{class_condition}]")
-            elif similarity_criteria == "css_selector":
-                css_selector = self.get_css_selector(element)
-                similar_elements = parent.find_elements(By.CSS_SELECTOR, css_selector)
-            elif similarity_criteria.startswith("attribute:"):
-                attribute_name = similarity_criteria.split(":", 1)[1]
-                attribute_value = element.get_attribute(attribute_name)
-                if not attribute_value:
-                    return []
-                if partial_match:
-                    similar_elements = parent.find_elements(By.XPATH, f".//*[contains(@{attribute_name}, '{attribute_value}')]")
-                else:
-                    similar_elements = parent.find_elements(By.XPATH, f".//*[@{attribute_name}='{attribute_value}']")
-            else:
+            if not custom_xpath and similarity_criteria not in ("tag", "class", "css_selector") and not similarity_criteria.startswith("attribute:"):
                 raise ValueError(f"Unsupported similarity criteria: {similarity_criteria}")
-            
-            # Filter out the reference element itself if it's included in the results
-            similar_elements = [el for el in similar_elements if el != element]
-            
-            # Use a set to ensure no duplicates
-            unique_elements = []
-            seen = set()
-            for el in similar_elements:
-                el_id = el.get_attribute("id") or el.get_attribute("outerHTML")
-                if el_id not in seen:
-                    seen.add(el_id)
-                    unique_elements.append(el)
-            
-            return unique_elements
+
+            css_selector = self.get_css_selector(element) if not custom_xpath and similarity_criteria == "css_selector" else None
+
+            # Resolve the parent, run the query and de-duplicate in the browser, all in a single round trip
+            return self.driver.execute_script(_FIND_SIMILAR_JS, element, similarity_criteria, match_all_classes, partial_match, custom_xpath, css_selector)
         except Exception:
             if reraise_exception:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return []
 
 
 
 
-    def click(self, selector_type: SelectorType = None, selector: str = None, element: Optional[WebElement] = None, skip_wait: bool = False, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
+    def click(self, selector_type: SelectorType = None, selector: str = None, element: Optional[WebElement] = None, skip_wait: bool = False, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False, fast: bool = False) -> bool:
         """
         Click an element.
         
@@ -493,6 +975,9 @@ class WebSession:
             timeout (int): The maximum time to wait for the element.
             suppress_traceback (bool): Whether to suppress the traceback print.
             raise_exc (bool): Whether to re-raise the exception.
+            fast (bool): Whether to click through JavaScript (element.click()) instead of a native click.
+                         This is faster and never intercepted, but does not fire real mouse events
+                         (mousedown/mouseup), so it is unsuitable for pages that listen for them.
         
         Returns:
             bool: True if the click is successful, False otherwise.
@@ -500,20 +985,23 @@ class WebSession:
         try:
             if not element and not selector_type and not selector:
                 raise ValueError("Element, selector_type, or selector must be provided.")
-            if not element:
-                element = self.find_element(selector_type, selector, skip_wait, timeout, suppress_traceback, raise_exc)
             if element:
-                return element.click() #self.safe_click(element)
+                selector_type = selector = None
+            else:
+                element = self._resolve_element(selector_type, selector, wait=not skip_wait, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
+            if element:
+                if fast:
+                    return bool(self._use_element(selector_type, selector, element, lambda el: self.driver.execute_script(_JS_CLICK, el)))
+                self._use_element(selector_type, selector, element, lambda el: el.click()) #self.safe_click(element)
+                return True
             return False
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return False
 
-    def safe_click(self, element: WebElement, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
+    def safe_click(self, element: WebElement, suppress_traceback: bool = False, raise_exc: bool = False, fast: bool = False) -> bool:
         """
         Safely click an element, handling potential interceptors.
         
@@ -521,6 +1009,7 @@ class WebSession:
             element (WebElement): The element to click.
             suppress_traceback (bool): Whether to suppress the traceback print.
             raise_exc (bool): Whether to re-raise the exception.
+            fast (bool): Whether to click through JavaScript, which cannot be intercepted but does not fire real mouse events.
         Returns:
             bool: True if the click is successful, False otherwise.
         
@@ -528,11 +1017,12 @@ class WebSession:
             This method is experimental.
         """
         try:
+            if fast:
+                return bool(self.driver.execute_script(_JS_CLICK, element))
             element.click()
             return True
         except ElementClickInterceptedException:
-            error_traceback = format_deeper_traceback()
-            print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             # Find the element that intercepted the click
             interceptor_element = self.driver.execute_script("""
                 var elem = arguments[0];
@@ -549,9 +1039,29 @@ class WebSession:
                 except Exception:   
                     if raise_exc:
                         raise
-                    if not suppress_traceback:
-                        error_traceback = format_deeper_traceback()
-                        print(clean_traceback(error_traceback))
+                    self._log_error(suppress_traceback)
+            return False
+
+    def fast_click_many(self, elements: List[WebElement], suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
+        """
+        Click several elements through JavaScript in a single round trip.
+        Like click(fast=True), this does not fire real mouse events.
+        
+        Args:
+            elements (List[WebElement]): The elements to click, in order.
+            suppress_traceback (bool): Whether to suppress the traceback print.
+            raise_exc (bool): Whether to re-raise the exception.
+        
+        Returns:
+            bool: True if all clicks were dispatched, False otherwise.
+        """
+        try:
+            self.driver.execute_script(_JS_CLICK_MANY, elements)
+            return True
+        except Exception:
+            if raise_exc:
+                raise
+            self._log_error(suppress_traceback)
             return False
 
     def right_click(self, selector_type: SelectorType, selector: str, skip_wait: bool = False, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
@@ -570,18 +1080,15 @@ class WebSession:
             bool: True if the right-click is successful, False otherwise.
         """
         try:
-            element = self.find_element(selector_type, selector, skip_wait, timeout, suppress_traceback, raise_exc)
+            element = self._resolve_element(selector_type, selector, wait=not skip_wait, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
             if element:
-                actions = ActionChains(self.driver)
-                actions.context_click(element).perform()
+                self._use_element(selector_type, selector, element, lambda el: self._perform_actions(lambda actions: actions.context_click(el)))
                 return True
             return False
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return False
 
     def type_text(self, selector_type: SelectorType, selector: str, text: str, skip_wait: bool = False, timeout: int = 10, interactable_timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
@@ -601,19 +1108,22 @@ class WebSession:
             bool: True if the text is successfully typed, False otherwise.
         """
         try:
-            element = self.find_element(selector_type, selector, skip_wait, timeout, suppress_traceback, raise_exc)
+            element = self._resolve_element(selector_type, selector, wait=not skip_wait, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
             if element:
-                if interactable_timeout != -1:
-                    WebDriverWait(self.driver, interactable_timeout).until(EC.element_to_be_clickable((By.XPATH, selector)))
-                element.send_keys(text)
+                try:
+                    self._use_element(selector_type, selector, element, lambda el: el.send_keys(text))
+                except ElementNotInteractableException:
+                    # Only pay for the interactability wait when the element isn't ready yet
+                    if interactable_timeout == -1:
+                        raise
+                    element = self._wait_until(self.driver, interactable_timeout, EC.element_to_be_clickable((self._by(selector_type), selector)))
+                    element.send_keys(text)
                 return True
             return False
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return False
 
     def clear(self, selector_type: SelectorType, selector: str, skip_wait: bool = False, timeout: int = 10, interactable_timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
@@ -632,19 +1142,22 @@ class WebSession:
             bool: True if the element is successfully cleared, False otherwise.
         """
         try:
-            element = self.find_element(selector_type, selector, skip_wait, timeout, suppress_traceback, raise_exc)
+            element = self._resolve_element(selector_type, selector, wait=not skip_wait, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
             if element:
-                if interactable_timeout != -1:
-                    WebDriverWait(self.driver, interactable_timeout).until(EC.element_to_be_clickable((By.XPATH, selector)))
-                element.clear()
+                try:
+                    self._use_element(selector_type, selector, element, lambda el: el.clear())
+                except ElementNotInteractableException:
+                    # Only pay for the interactability wait when the element isn't ready yet
+                    if interactable_timeout == -1:
+                        raise
+                    element = self._wait_until(self.driver, interactable_timeout, EC.element_to_be_clickable((self._by(selector_type), selector)))
+                    element.clear()
                 return True
             return False
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return False
 
     def hover(self, selector_type: SelectorType, selector: str, skip_wait: bool = False, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
@@ -663,21 +1176,39 @@ class WebSession:
             bool: True if the hover is successful, False otherwise.
         """
         try:
-            element = self.find_element(selector_type, selector, skip_wait, timeout)
+            element = self._resolve_element(selector_type, selector, wait=not skip_wait, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
             if element:
-                actions = ActionChains(self.driver)
-                actions.move_to_element(element).perform()
+                self._use_element(selector_type, selector, element, lambda el: self._perform_actions(lambda actions: actions.move_to_element(el)))
                 return True
             return False
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
+            return False
+
+    def hover_click(self, element: WebElement, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
+        """
+        Move to an element and click it as a single action chain (one request to the driver).
+        
+        Args:
+            element (WebElement): The element to hover over and click.
+            suppress_traceback (bool): Whether to suppress the traceback print.
+            raise_exc (bool): Whether to re-raise the exception.
+        
+        Returns:
+            bool: True if the hover and click are successful, False otherwise.
+        """
+        try:
+            self._perform_actions(lambda actions: actions.move_to_element(element).click())
+            return True
+        except Exception:
+            if raise_exc:
+                raise
+            self._log_error(suppress_traceback)
             return False
 
-    def extract(self, selector_type: Optional[SelectorType] = None, selector: Optional[str] = None, element: Optional[WebElement] = None, attribute: Optional[str] = None, skip_wait: bool = False, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> Optional[str]:
+    def extract(self, selector_type: Optional[SelectorType] = None, selector: Optional[str] = None, element: Optional[WebElement] = None, attribute: Optional[str] = None, skip_wait: bool = False, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False, attributes: Optional[List[str]] = None) -> Optional[Union[str, Dict[str, Optional[str]]]]:
         """
         Extract data from an element.
         
@@ -690,9 +1221,12 @@ class WebSession:
             timeout (int): The maximum time to wait for the element.
             suppress_traceback (bool): Whether to suppress the traceback print.
             raise_exc (bool): Whether to re-raise the exception.
+            attributes (List[str]): Several attributes to extract at once, together with the text, in a single call.
+                                    Takes precedence over `attribute`. Values are the raw attribute values (getAttribute).
         
         Returns:
             str: The extracted data, or False if extraction does not succeed, and None if extraction errors.
+                 When `attributes` is given, a dict mapping "__text__" and each attribute name to its value instead.
         """
         try:
             sub_element = None
@@ -700,58 +1234,65 @@ class WebSession:
             if element:
                 # If both element and selector/selector_type are provided, find the sub-element within the element
                 if selector_type and selector:
-                    sub_element = self.find_element(selector_type, selector, element, suppress_traceback, raise_exc)
+                    sub_element = self._resolve_element(selector_type, selector, element=element, wait=not skip_wait, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
                 else:
                     sub_element = element
+                    # Passed in directly, so there is nothing to re-find it with
+                    selector_type = selector = None
             else:
                 # If only selector/selector_type are provided, find the element
-                sub_element = self.find_element(selector_type, selector, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
+                sub_element = self._resolve_element(selector_type, selector, wait=not skip_wait, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
+            
+            def read(el: WebElement) -> Union[str, Dict[str, Optional[str]]]:
+                if attributes is not None:
+                    return self.driver.execute_script(_EXTRACT_MANY_JS, el, list(attributes))
+                if attribute and attribute != "__text__":
+                    return el.get_attribute(attribute)
+                return el.text
             
             if sub_element:
-                if attribute == "__text__":
-                    return sub_element.text
-                elif attribute:
-                    return sub_element.get_attribute(attribute)
-                else:
-                    return sub_element.text
+                return self._use_element(selector_type, selector, sub_element, read, parent=element)
             return False
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return None
 
-    def run_js(self, selector_type: SelectorType, selector: str, script: str, skip_wait: bool = False, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> Optional[Any]:
+    def run_js(self, selector_type: Optional[SelectorType], selector: Optional[str], script: str, skip_wait: bool = False, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False, element: Optional[WebElement] = None) -> Optional[Any]:
         """
         Run JavaScript on an element.
+        The element is passed to the script as arguments[0].
         
         Args:
-            selector_type (SelectorType): The type of selector (XPATH or CSS).
-            selector (str): The selector string.
+            selector_type (SelectorType): The type of selector (XPATH or CSS). Ignored if element is given.
+            selector (str): The selector string. Ignored if element is given.
             script (str): The JavaScript code to run.
             skip_wait (bool): Whether to skip waiting for the element.
             timeout (int): The maximum time to wait for the element.
             suppress_traceback (bool): Whether to suppress the traceback print.
             raise_exc (bool): Whether to re-raise the exception.
+            element (WebElement): An already-found element to run the script on, which skips the lookup entirely.
+                                  Prefer this when you already hold a reference, e.g. one returned by find_element.
         
         Returns:
             Any: The result of the JavaScript execution, or None if execution fails.
         """
         try:
-            element = self.find_element(selector_type, selector, skip_wait, timeout)
+            if element is None:
+                element = self._resolve_element(selector_type, selector, wait=not skip_wait, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
+            else:
+                # Passed in directly, so there is nothing to re-find it with
+                selector_type = selector = None
             if element:
-                result = self.driver.execute_script(script, element)
-                print(f"JavaScript execution result: {result}")
+                result = self._use_element(selector_type, selector, element, lambda el: self.driver.execute_script(script, el))
+                logger.debug("JavaScript execution result: %s", result)
                 return result
             return None
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return None
 
     def get_page_title(self, suppress_traceback: bool = False, raise_exc: bool = False) -> Optional[str]:
@@ -766,9 +1307,7 @@ class WebSession:
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return None
 
     def get_page_source(self, suppress_traceback: bool = False, raise_exc: bool = False) -> Optional[str]:
@@ -783,9 +1322,7 @@ class WebSession:
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return None
 
     def get_current_url(self, suppress_traceback: bool = False, raise_exc: bool = False) -> Optional[str]:
@@ -800,9 +1337,28 @@ class WebSession:
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
+            return None
+
+    def get_page_info(self, include_source: bool = False, suppress_traceback: bool = False, raise_exc: bool = False) -> Optional[Dict[str, str]]:
+        """
+        Get the page title and current URL (and optionally the page source) in a single round trip.
+        
+        Args:
+            include_source (bool): Whether to include the page source.
+            suppress_traceback (bool): Whether to suppress the traceback print.
+            raise_exc (bool): Whether to re-raise the exception.
+        
+        Returns:
+            dict: A dict with "title" and "url" keys, plus "source" if include_source is True, or None if retrieval fails.
+                  The source is serialized like ChromeDriver's page_source; other drivers may format theirs differently.
+        """
+        try:
+            return self.driver.execute_script(_PAGE_INFO_WITH_SOURCE_JS if include_source else _PAGE_INFO_JS)
+        except Exception:
+            if raise_exc:
+                raise
+            self._log_error(suppress_traceback)
             return None
 
     def scroll(self, direction: str = "down", amount: Optional[int] = None, selector_type: Optional[SelectorType] = None, selector: Optional[str] = None, element: Optional[WebElement] = None, x: Optional[int] = None, y: Optional[int] = None, to_end: bool = False, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
@@ -827,57 +1383,36 @@ class WebSession:
         """
         try:
             if x is not None and y is not None:
-                self.driver.execute_script(f"window.scrollTo({x}, {y});")
-            elif direction == "down":
-                if amount:
-                    self.driver.execute_script(f"window.scrollBy(0, {amount});")
-                elif element:
-                    if to_end:
-                        self.driver.execute_script("arguments[0].scrollIntoView(false);", element)
-                    else:
-                        self.driver.execute_script("arguments[0].scrollIntoView();", element)
-                elif selector_type and selector:
-                    element = self.find_element(selector_type, selector, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
-                    if element:
-                        if to_end:
-                            self.driver.execute_script("arguments[0].scrollIntoView(false);", element)
-                        else:
-                            self.driver.execute_script("arguments[0].scrollIntoView();", element)
-                else:
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            elif direction == "up":
-                if amount:
-                    self.driver.execute_script(f"window.scrollBy(0, -{amount});")
-                elif element:
-                    if to_end:
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                    else:
-                        self.driver.execute_script("arguments[0].scrollIntoView();", element)
-                elif selector_type and selector:
-                    element = self.find_element(selector_type, selector, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
-                    if element:
-                        if to_end:
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                        else:
-                            self.driver.execute_script("arguments[0].scrollIntoView();", element)
-                else:
-                    self.driver.execute_script("window.scrollTo(0, 0);")
-            elif direction == "to_element":
+                self.driver.execute_script(_SCROLL_TO_JS, x, y)
+                return True
+            if direction not in ("down", "up", "to_element"):
+                raise ValueError("Invalid scroll parameters")
+
+            if amount and direction != "to_element":
+                key = (direction, "amount", False)
+            elif element or (selector_type and selector):
                 if element:
-                    self.driver.execute_script("arguments[0].scrollIntoView();", element)
-                elif selector_type and selector:
+                    # Passed in directly, so there is nothing to re-find it with
+                    selector_type = selector = None
+                else:
                     element = self.find_element(selector_type, selector, timeout=timeout, suppress_traceback=suppress_traceback, raise_exc=raise_exc)
-                    if element:
-                        self.driver.execute_script("arguments[0].scrollIntoView();", element)
+                    if not element:
+                        return True
+                key = (direction, "element", bool(to_end) and direction != "to_element")
             else:
-                raise ValueError("Invalid scroll parameters")
+                key = (direction, "page", False)
+
+            script = _SCROLL_SCRIPTS.get(key)
+            if script:
+                if key[1] == "element":
+                    self._use_element(selector_type, selector, element, lambda el: self.driver.execute_script(script, el))
+                else:
+                    self.driver.execute_script(script, amount)
             return True
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return False
 
     def go_to(self, url: str, suppress_traceback: bool = False, raise_exc: bool = False, return_status: bool = False) -> Optional[bool]:
@@ -895,16 +1430,17 @@ class WebSession:
         """
         try:
             self.driver.get(url)
+            self._on_navigation()
             if return_status:
+                if self._page_load_strategy == "normal":
+                    return True
                 # Check if the document is fully loaded
                 ready_state = self.driver.execute_script("return document.readyState")
                 return ready_state == "complete"
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             if return_status:
                 return False
         return None
@@ -919,12 +1455,11 @@ class WebSession:
         """
         try:
             self.driver.refresh()
+            self._on_navigation()
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
 
     def back(self, suppress_traceback: bool = False, raise_exc: bool = False) -> None:
         """
@@ -936,12 +1471,11 @@ class WebSession:
         """
         try:
             self.driver.back()
+            self._on_navigation()
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
 
     def forward(self, suppress_traceback: bool = False, raise_exc: bool = False) -> None:
         """
@@ -953,12 +1487,24 @@ class WebSession:
         """
         try:
             self.driver.forward()
+            self._on_navigation()
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
+
+    def _serialize_subtree(self, element: WebElement, include_html: bool = False) -> Dict[str, Any]:
+        """
+        Serialize an element and its descendants in the browser with a single script call.
+        
+        Args:
+            element (WebElement): The root element.
+            include_html (bool): Whether to also return the root's outerHTML under the "html" key.
+        
+        Returns:
+            dict: A nested {"tag", "attrs", "text", "children"} tree, where "attrs" is a list of [name, value] pairs.
+        """
+        return self.driver.execute_script(_SUBTREE_JS, element, include_html)
 
     def show_structure(self, element: Optional[WebElement] = None, selector_type: Optional[SelectorType] = None, selector: Optional[str] = None, indent: int = 0, suppress_traceback: bool = False, raise_exc: bool = False, save_to_file: bool = False, file_path: str = "structure_output.html") -> None:
         """
@@ -975,20 +1521,22 @@ class WebSession:
             file_path (str): The file path to save the output if save_to_file is True.
         """
         try:
-            output = []
-
-            def _show_structure(element, indent):
-                indent_str = ' ' * (indent * 2)
-                tag_name = element.tag_name
-                attributes = ' '.join([f'{attr["name"]}="{attr["value"]}"' for attr in element.get_property('attributes')])
-                text = element.text.strip()
-                line = f"{indent_str}<{tag_name} {attributes}> {text}"
-                output.append(line)
-                print(line)
-
-                children = element.find_elements(By.XPATH, './*')
-                for child in children:
-                    _show_structure(child, indent + 1)
+            def _show_structure(tree, indent, file):
+                # Pre-order walk with an explicit stack, so deep trees can't hit the recursion limit
+                stack = [(tree, indent)]
+                while stack:
+                    node, depth = stack.pop()
+                    indent_str = ' ' * (depth * 2)
+                    tag_name = node["tag"]
+                    attributes = ' '.join([f'{name}="{value}"' for name, value in node["attrs"]])
+                    text = node["text"]
+                    line = f"{indent_str}<{tag_name} {attributes}> {text}"
+                    # Stream straight to the file instead of collecting the whole tree in memory
+                    if file:
+                        file.write(line + "\n")
+                    print(line)
+
+                    stack.extend((child, depth + 1) for child in reversed(node["children"]))
 
             # Determine the root element to start from
             if element and selector_type and selector:
@@ -1005,19 +1553,19 @@ class WebSession:
                 print("Root element not found.")
                 return
 
-            _show_structure(root_element, indent)
+            # Fetch the whole subtree in one round trip, then walk it locally
+            tree = self._serialize_subtree(root_element)
 
             if save_to_file:
                 with open(file_path, 'w') as file:
-                    file.write("\n".join(output))
+                    _show_structure(tree, indent, file)
+            else:
+                _show_structure(tree, indent, None)
 
-        except Exception as e:
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-                print(f"Error displaying structure: {e}")
+            self._log_error(suppress_traceback, "Error displaying structure")
 
 
 
@@ -1037,37 +1585,28 @@ class WebSession:
                 print("No elements provided for structure visualization.")
                 return
 
-            output = []
             element_id = 0
 
-            def _generate_structure(element, indent):
+            def _generate_structure(tree, write):
                 nonlocal element_id
-                indent_str = ' ' * (indent * 2)
-                tag_name = element.tag_name
-                attributes = ' '.join([f'{attr["name"]}="{attr["value"]}"' for attr in element.get_property('attributes')])
-                text = element.text.strip()
-                element_id += 1
-                element_id_str = f"element-{element_id}"
-                children_id_str = f"{element_id_str}-children"
-                divider_id_str = f"{element_id_str}-divider"
-                line = f"""
-                {indent_str}<div class='element' id='{element_id_str}' data-tag='{tag_name}' data-attributes='{attributes}' data-text='{text}'>
-                    <span class='toggle' onclick="toggleVisibility('{children_id_str}', '{divider_id_str}', this)">&#9660;</span>
-                    <span class='tag'>&lt;{tag_name} {attributes}&gt;</span> {text}
-                    <div class='selectors'>
-                        <button onclick="copyCssSelector('{element_id_str}')">Copy CSS Selector</button>
-                        <button onclick="copyAttributes('{element_id_str}')">Copy Attributes</button>
-                    </div>
-                    <div id='{children_id_str}' class='children'>
-                """
-                output.append(line)
-
-                children = element.find_elements(By.XPATH, './*')
-                for child in children:
-                    _generate_structure(child, indent + 1)
-
-                closing_tag = f"{indent_str}</div>\n{indent_str}&lt;/{tag_name}&gt;</div><hr class='divider' id='{divider_id_str}'>"
-                output.append(closing_tag)
+                # Pre-order walk with an explicit stack; a node's closing markup is pushed
+                # beneath its children so it is written once they are all done
+                stack = [(tree, 0)]
+                while stack:
+                    node, indent = stack.pop()
+                    if isinstance(node, str):
+                        write(node)
+                        continue
+                    indent_str = ' ' * (indent * 2)
+                    tag_name = node["tag"]
+                    attributes = ' '.join([f'{name}="{value}"' for name, value in node["attrs"]])
+                    text = node["text"]
+                    element_id += 1
+                    element_id_str = f"element-{element_id}"
+                    write(_NODE_OPEN_TMPL.format(indent=indent_str, eid=element_id_str, tag=tag_name, attrs=attributes, text=text))
+
+                    stack.append((_NODE_CLOSE_TMPL.format(indent=indent_str, eid=element_id_str, tag=tag_name), indent))
+                    stack.extend((child, indent + 1) for child in reversed(node["children"]))
 
             # Determine the root elements to start from
             if isinstance(elements, list):
@@ -1075,201 +1614,88 @@ class WebSession:
             else:
                 root_elements = [elements]
 
-            # Initialize tqdm progress bar if installed
-            if tqdm_installed:
-                progress_bar = tqdm(total=len(root_elements), desc="Generating structure", unit="element")
+            # Check the roots before creating the file so a missing one doesn't leave a partial page behind
+            if not all(root_elements):
+                print("Root element not found.")
+                return
+
+            # Initialize tqdm progress bar if installed; a bar isn't worth its setup for a few roots
+            if _TQDM is not None and len(root_elements) >= 4:
+                progress_bar = _TQDM(total=len(root_elements), desc="Generating structure", unit="element")
             else:
                 progress_bar = None
 
-            for root_element in root_elements:
-                if not root_element:
-                    print("Root element not found.")
-                    return
+            # Stream the page to the file as it is generated, around the static template.
+            # Each root's subtree and outerHTML is fetched in one round trip.
+            with open(file_path, 'w', buffering=1 << 16) as file:
+                file.write(_HTML_HEAD)
+
+                for root_element in root_elements:
+                    tree = self._serialize_subtree(root_element, include_html=True)
+                    _generate_structure(tree, file.write)
 
-                # Generate structure for the root element and its immediate children
-                _generate_structure(root_element, 0)
+                    # Add the real DOM rendering for the root element
+                    file.write(f"<div class='real-dom-container'>{tree['html']}</div>")
 
-                # Add the real DOM rendering for the root element
-                output.append(f"<div class='real-dom-container'>{root_element.get_attribute('outerHTML')}</div>")
+                    # Update progress bar if tqdm is installed
+                    if progress_bar:
+                        progress_bar.update(1)
 
-                # Update progress bar if tqdm is installed
-                if progress_bar:
-                    progress_bar.update(1)
+                file.write(_HTML_FOOTER)
 
             # Close the progress bar if tqdm is installed
             if progress_bar:
                 progress_bar.close()
 
-            # HTML template for the visualization
-            html_template = f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>DOM Structure Visualization</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; }}
-                    .element {{ margin-left: 20px; position: relative; }}
-                    .tag {{ color: blue; cursor: pointer; }}
-                    .tag:hover {{ text-decoration: underline; }}
-                    .attributes {{ color: red; }}
-                    .text {{ color: green; }}
-                    .hidden {{ display: none; }}
-                    .highlight {{ background-color: yellow; }}
-                    .code-container {{ border-bottom: 1px solid #ccc; padding-bottom: 10px; }}
-                    .real-dom-container {{ padding: 20px; border: 1px solid #ccc; margin-top: 20px; }}
-                    .selectors {{ position: absolute; right: 0; top: 0; }}
-                    .selectors button {{ margin-left: 5px; }}
-                    .children {{ margin-left: 20px; }}
-                    .toggle {{ cursor: pointer; font-weight: bold; }}
-                    .divider {{ border-top: 1px solid #ccc; margin: 10px 0; }}
-                    .search-bar {{ margin-bottom: 20px; }}
-                </style>
-                <script>
-                    function copyToClipboard(text) {{
-                        navigator.clipboard.writeText(text).then(() => {{
-                            alert('Copied to clipboard: ' + text);
-                        }}, (err) => {{
-                            console.error('Could not copy text: ', err);
-                        }});
-                    }}
-
-                    function copyCssSelector(elementId) {{
-                        const element = document.getElementById(elementId);
-                        const classList = element.getAttribute('data-attributes').match(/class="([^"]*)"/);
-                        if (classList) {{
-                            const cssSelector = '.' + classList[1].split(' ').join('.');
-                            copyToClipboard(cssSelector);
-                        }} else {{
-                            alert('No class attribute found.');
-                        }}
-                    }}
-
-                    function copyAttributes(elementId) {{
-                        const element = document.getElementById(elementId);
-                        const attributes = element.getAttribute('data-attributes');
-                        copyToClipboard(attributes);
-                    }}
-
-                    function toggleVisibility(childrenId, dividerId, toggleElement) {{
-                        const children = document.getElementById(childrenId);
-                        const divider = document.getElementById(dividerId);
-                        if (children && divider) {{
-                            if (children.style.display === 'none') {{
-                                children.style.display = 'block';
-                                divider.style.display = 'block';
-                                toggleElement.innerHTML = '&#9660;';
-                            }} else {{
-                                children.style.display = 'none';
-                                divider.style.display = 'none';
-                                toggleElement.innerHTML = '&#9654;';
-                            }}
-                        }} else {{
-                            console.error('Children or divider not found for IDs:', childrenId, dividerId);
-                        }}
-                    }}
-
-                    function filterElements() {{
-                        const searchTerm = document.getElementById('search-input').value.toLowerCase();
-                        document.querySelectorAll('.element').forEach(element => {{
-                            const text = element.getAttribute('data-text').toLowerCase();
-                            const tag = element.getAttribute('data-tag').toLowerCase();
-                            const attributes = element.getAttribute('data-attributes').toLowerCase();
-                            if (text.includes(searchTerm) || tag.includes(searchTerm) || attributes.includes(searchTerm)) {{
-                                element.style.display = 'block';
-                            }} else {{
-                                element.style.display = 'none';
-                            }}
-                        }});
-                    }}
-
-                    document.addEventListener('DOMContentLoaded', () => {{
-                        document.querySelectorAll('.tag').forEach(tag => {{
-                            tag.addEventListener('mouseover', () => {{
-                                const elementId = tag.parentElement.id;
-                                const realElement = document.querySelector(`[data-element-id='${{elementId}}']`);
-                                if (realElement) {{
-                                    realElement.classList.add('highlight');
-                                }}
-                            }});
-                            tag.addEventListener('mouseout', () => {{
-                                const elementId = tag.parentElement.id;
-                                const realElement = document.querySelector(`[data-element-id='${{elementId}}']`);
-                                if (realElement) {{
-                                    realElement.classList.remove('highlight');
-                                }}
-                            }});
-                        }});
-                    }});
-                </script>
-            </head>
-            <body>
-                <h1>DOM Structure Visualization</h1>
-                <div class="search-bar">
-                    <input type="text" id="search-input" onkeyup="filterElements()" placeholder="Search for elements...">
-                </div>
-                <div class="code-container">{''.join(output)}</div>
-            </body>
-            </html>
-            """
-
-            # Save the HTML to a file
-            with open(file_path, 'w') as file:
-                file.write(html_template)
-
             print(f"Structure visualization saved to {file_path}")
 
-        except Exception as e:
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error generating structure HTML: {e}")
+            self._log_error(suppress_traceback, "Error generating structure HTML")
 
 
 
 
 
+    def _cached_selector(self, cache: OrderedDict, script: str, element: WebElement) -> str:
+        """
+        Return the selector the script generates for an element, served from a bounded LRU cache.
+        Entries are keyed by the element's remote id and dropped on navigation.
+        
+        Args:
+            cache (OrderedDict): The cache to use (CSS selectors or XPaths).
+            script (str): The script that generates the selector for arguments[0].
+            element (WebElement): The element to generate the selector for.
+        
+        Returns:
+            str: The generated selector.
+        """
+        key = element.id
+        selector = _lru_get(cache, key)
+        if selector is not None:
+            return selector
+        return _lru_put(cache, key, self.driver.execute_script(script, element))
+
     def get_xpath(self, element: WebElement, timeout: int = 10, suppress_traceback: bool = False, raise_exc: bool = False) -> str:
         """
         Generate the XPath for a given element.
         
         Args:
             element (WebElement): The element to generate the XPath for.
-            timeout (int): The maximum time to attempt generating the XPath.
+            timeout (int): Unused; the XPath is computed in a single browser call. Kept for backwards compatibility.
             suppress_traceback (bool): Whether to suppress the traceback print.
             raise_exc (bool): Whether to re-raise the exception.
         
         Returns:
             str: The XPath of the element.
         """
-        start_time = time.time()
         try:
-            components = []
-            child = element
-            while child is not None:
-                if time.time() - start_time > timeout:
-                    raise TimeoutError("Timeout while generating XPath.")
-                parent = child.find_element(By.XPATH, '..')
-                children = parent.find_elements(By.XPATH, './*')
-                index = 1
-                for i, sibling in enumerate(children):
-                    if sibling == child:
-                        index = i + 1
-                        break
-                components.append(f"{child.tag_name}[{index}]")
-                child = parent if parent.tag_name.lower() != 'html' else None
-            components.reverse()
-            return '/' + '/'.join(components)
-        except Exception as e:
+            return self._cached_selector(self._xpath_cache, _XPATH_JS, element)
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error generating XPath: {e}")
+            self._log_error(suppress_traceback, "Error generating XPath")
             return ""
         
 
@@ -1284,30 +1710,18 @@ class WebSession:
             str: The CSS selector of the element.
         """
         try:
-            path = []
-            while element:
-                sub_selector = element.tag_name
-                if element.get_attribute('id'):
-                    sub_selector += f"#{element.get_attribute('id')}"
-                elif element.get_attribute('class'):
-                    sub_selector += f".{'.'.join(element.get_attribute('class').split())}"
-                siblings = element.find_elements(By.XPATH, f"./preceding-sibling::{element.tag_name}")
-                if len(siblings) > 0:
-                    sub_selector += f":nth-of-type({len(siblings) + 1})"
-                path.insert(0, sub_selector)
-                element = element.find_element(By.XPATH, '..') if element.tag_name.lower() != 'html' else None
-            return ' > '.join(path)
-        except Exception as e:
+            # Walk up to <html> in the browser instead of ~4 driver calls per ancestor
+            return self._cached_selector(self._css_selector_cache, _CSS_SELECTOR_JS, element)
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error generating CSS selector: {e}")
+            self._log_error(suppress_traceback, "Error generating CSS selector")
             return ""
 
 
-    def class_to_css_selector(self, class_attr: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def class_to_css_selector(class_attr: str) -> str:
         """
         Convert a space-separated class attribute string to a CSS selector format.
         
@@ -1317,9 +1731,7 @@ class WebSession:
         Returns:
             str: The CSS selector format of the class attribute.
         """
-        classes = class_attr.split()
-        css_selector = '.' + '.'.join(classes)
-        return css_selector
+        return '.' + '.'.join(css_escape(cls) for cls in _CLASS_SPLIT.findall(class_attr))
 
 
 
@@ -1337,93 +1749,89 @@ class WebSession:
             List[WebElement]: A list of elements matching the attributes.
         """
         try:
-            # Convert browser format to Selenium format if necessary
-            if '=' in attributes and '"' in attributes:
-                attributes = self._convert_browser_format_to_selenium(attributes, raise_exc, suppress_traceback)
-            
-            # Build the XPath expression
-            xpath_expression = self._build_xpath_from_attributes(attributes, raise_exc, suppress_traceback)
+            # Build a CSS attribute selector; browsers resolve these far faster than XPath
+            css_selector = self._build_css_from_attributes(attributes, raise_exc, suppress_traceback)
+            if not css_selector:
+                return []
             
-            # Find elements using the XPath expression
-            elements = self.driver.find_elements(By.XPATH, xpath_expression)
+            # Find elements using the CSS selector
+            elements = self.driver.find_elements(By.CSS_SELECTOR, css_selector)
             return elements
-        except InvalidSelectorException as e:
+        except InvalidSelectorException:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error finding elements by attributes: {e}")
+            self._log_error(suppress_traceback, "Error finding elements by attributes")
             return []
 
 
 
-    def _convert_browser_format_to_selenium(self, attributes: str, raise_exc: bool = False, suppress_traceback: bool = False) -> str:
+    def count_elements_by_css(self, css_selector: str, suppress_traceback: bool = False, raise_exc: bool = False) -> int:
         """
-        Convert browser format attributes to Selenium format.
+        Count the elements matching a CSS selector without creating a WebElement for each match.
         
         Args:
-            attributes (str): The attributes string in browser format.
-            raise_exc (bool): Whether to re-raise the exception.
+            css_selector (str): The CSS selector to match.
             suppress_traceback (bool): Whether to suppress the traceback print.
+            raise_exc (bool): Whether to re-raise the exception.
         
         Returns:
-            str: The attributes string in Selenium format.
+            int: The number of matching elements, or 0 if the count fails.
         """
         try:
-            # Split the attributes string by spaces
-            parts = attributes.split('" ')
-            selenium_attributes = []
-            for part in parts:
-                if '=' in part:
-                    key, value = part.split('=', 1)
-                    value = value.strip('"')
-                    selenium_attributes.append(f'{key}="{value}"')
-            return ' '.join(selenium_attributes)
-        except Exception as e:
+            return self.driver.execute_script(_COUNT_CSS_JS, css_selector)
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error converting browser format to Selenium format: {e}")
+            self._log_error(suppress_traceback, "Error counting elements by CSS selector")
+            return 0
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _css_from_attributes(attributes: str) -> str:
+        """
+        Cached core of _build_css_from_attributes.
+        
+        Args:
+            attributes (str): The attributes string, in Selenium or browser format.
+        
+        Returns:
+            str: The CSS selector, or an empty string if no attributes were given.
+        """
+        # One regex pass over both formats; quoted values may contain spaces
+        conditions = []
+        for name, quoted, bare in (m.groups() for m in _ATTR_PAIR_RE.finditer(attributes)):
+            name = css_escape(name)
+            if quoted is None:
+                conditions.append(f'[{name}="{css_escape(bare)}"]')
+            elif quoted:
+                conditions.append(f'[{name}*="{css_escape(quoted)}"]')
+            else:
+                # *="" matches nothing in CSS; contains(@name, "") matched any element with the attribute
+                conditions.append(f'[{name}]')
+        if not conditions:
             return ""
+        return '*' + ''.join(conditions)
 
-    def _build_xpath_from_attributes(self, attributes: str, raise_exc: bool = False, suppress_traceback: bool = False) -> str:
+    def _build_css_from_attributes(self, attributes: str, raise_exc: bool = False, suppress_traceback: bool = False) -> str:
         """
-        Build an XPath expression from the attributes string.
+        Build a CSS attribute selector from the attributes string.
+        Quoted values match as substrings, unquoted values must match exactly.
         
         Args:
-            attributes (str): The attributes string in Selenium format.
+            attributes (str): The attributes string, in Selenium or browser format.
             raise_exc (bool): Whether to re-raise the exception.
             suppress_traceback (bool): Whether to suppress the traceback print.
         
         Returns:
-            str: The XPath expression.
+            str: The CSS selector, or an empty string if no attributes were given.
         """
         try:
-            # Split the attributes string by spaces
-            parts = attributes.split(' ')
-            conditions = []
-            for part in parts:
-                if '=' in part:
-                    key, value = part.split('=', 1)
-                    # Handle quotes in the value
-                    if '"' in value:
-                        conditions.append(f'contains(@{key}, "{value.replace("\"", "")}")')
-                    else:
-                        conditions.append(f'@{key}="{value}"')
-            xpath_expression = f'//*[{ " and ".join(conditions) }]'
-            return xpath_expression
-        except Exception as e:
+            return self._css_from_attributes(attributes)
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error building XPath from attributes: {e}")
+            self._log_error(suppress_traceback, "Error building CSS selector from attributes")
             return ""
-        
 
 
 
@@ -1437,19 +1845,8 @@ class WebSession:
         Returns:
             str: The escaped CSS selector format.
         """
-        def escape_special_chars(s: str) -> str:
-            special_chars = r'([!"#$%&\'()*+,\/:;<=>?@[\\\]^`{|}~])'
-            return re.sub(special_chars, r'\\\1', s)
-        
-        # Split by structural characters while keeping them in the result
-        segments = re.split(r'(\s+|>|\+|~)', selector)
-        
-        # Escape special characters in each segment, but not the structural characters
-        escaped_segments = [escape_special_chars(segment) if not re.match(r'(\s+|>|\+|~)', segment) else segment for segment in segments]
-        
-        # Reconstruct the selector
-        escaped_selector = ''.join(escaped_segments)
-        return escaped_selector
+        # One pass over the whole selector: whitespace and the > + ~ combinators are not in the escaped set
+        return _CSS_SPECIAL_RE.sub(r'\\\1', selector)
     
     def modify_element(self, element: WebElement, attributes: Optional[Dict[str, str]] = None, text: Optional[str] = None, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
         """
@@ -1466,22 +1863,15 @@ class WebSession:
             bool: True if the modification is successful, False otherwise.
         """
         try:
-            # Modify attributes
-            if attributes:
-                for attr, value in attributes.items():
-                    self.driver.execute_script(f"arguments[0].setAttribute(arguments[1], arguments[2]);", element, attr, value)
-            
-            # Modify text content
-            if text is not None:
-                self.driver.execute_script("arguments[0].textContent = arguments[1];", element, text)
+            # Attributes and text are applied in a single round trip
+            if attributes or text is not None:
+                self.driver.execute_script(_MODIFY_ELEMENT_JS, element, attributes or {}, text)
             
             return True
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return False
         
 
@@ -1498,22 +1888,28 @@ class WebSession:
             str: The page content as a string if file_name is None, otherwise None.
         """
         try:
-            page_content = self.driver.page_source
-            
             if file_name:
-                with open(file_name, 'w', encoding='utf-8') as file:
-                    file.write(page_content)
+                # Write the source straight through without holding it or translating newlines
+                with open(file_name, 'w', encoding='utf-8', newline='') as file:
+                    file.write(self.driver.page_source)
                 return None
             else:
-                return page_content
+                return self.driver.page_source
         except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
+            self._log_error(suppress_traceback)
             return None
         
+    # compare_elements() handlers keyed by comparison method; "attribute:<name>" is matched separately
+    _COMPARATORS = {
+        "tag": lambda self, e1, e2: e1.tag_name == e2.tag_name,
+        "class": lambda self, e1, e2: bool(self.driver.execute_script(_SAME_CLASSES_JS, e1, e2)),
+        "css_selector": lambda self, e1, e2: self.get_css_selector(e1) == self.get_css_selector(e2),
+        "xpath": lambda self, e1, e2: self.get_xpath(e1) == self.get_xpath(e2),
+        "text": lambda self, e1, e2: bool(self.driver.execute_script(_SAME_TEXT_JS, e1, e2)),
+    }
+
     def compare_elements(self, element1: WebElement, element2: WebElement, comparison_method: str = "class", suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
         """
         Compare two elements based on the specified comparison method.
@@ -1529,22 +1925,9 @@ class WebSession:
             bool: True if the elements are considered similar based on the comparison method, False otherwise.
         """
         try:
-            if comparison_method == "tag":
-                return element1.tag_name == element2.tag_name
-            elif comparison_method == "class":
-                class1 = set(element1.get_attribute("class").split())
-                class2 = set(element2.get_attribute("class").split())
-                return class1 == class2
-            elif comparison_method == "css_selector":
-                css_selector1 = self.get_css_selector(element1)
-                css_selector2 = self.get_css_selector(element2)
-                return css_selector1 == css_selector2
-            elif comparison_method == "xpath":
-                xpath1 = self.get_xpath(element1)
-                xpath2 = self.get_xpath(element2)
-                return xpath1 == xpath2
-            elif comparison_method == "text":
-                return element1.text.strip() == element2.text.strip()
+            comparator = self._COMPARATORS.get(comparison_method)
+            if comparator is not None:
+                return comparator(self, element1, element2)
             elif comparison_method.startswith("attribute:"):
                 attribute_name = comparison_method.split(":", 1)[1]
                 attribute_value1 = element1.get_attribute(attribute_name)
@@ -1552,13 +1935,10 @@ class WebSession:
                 return attribute_value1 == attribute_value2
             else:
                 raise ValueError(f"Unsupported comparison method: {comparison_method}")
-        except Exception as e:
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error comparing elements: {e}")
+            self._log_error(suppress_traceback, "Error comparing elements")
             return False
 
 
@@ -1583,59 +1963,19 @@ class WebSession:
             bool: True if the elements are considered similar based on comprehensive criteria, False otherwise.
         """
         try:
-            # Compare tag names
-            if element1.tag_name != element2.tag_name:
-                return False
-            
-            # Compare class names
-            class1 = set(element1.get_attribute("class").split())
-            class2 = set(element2.get_attribute("class").split())
-            if class1 != class2:
-                return False
-            
-            # Compare attributes
-            attributes1 = {attr["name"]: attr["value"] for attr in element1.get_property("attributes")}
-            attributes2 = {attr["name"]: attr["value"] for attr in element2.get_property("attributes")}
-            
-            if include_attributes:
-                attributes1 = {k: v for k, v in attributes1.items() if k in include_attributes}
-                attributes2 = {k: v for k, v in attributes2.items() if k in include_attributes}
-            
-            if exclude_attributes:
-                attributes1 = {k: v for k, v in attributes1.items() if k not in exclude_attributes}
-                attributes2 = {k: v for k, v in attributes2.items() if k not in exclude_attributes}
-            
-            if attributes1 != attributes2:
-                return False
-            
-            # Compare text content
-            if element1.text.strip() != element2.text.strip():
-                return False
-            
-            # Optionally, compare CSS properties
-            if compare_css:
-                css_properties1 = {prop: element1.value_of_css_property(prop) for prop in element1.value_of_css_property("")}
-                css_properties2 = {prop: element2.value_of_css_property(prop) for prop in element2.value_of_css_property("")}
-                
-                if include_css_properties:
-                    css_properties1 = {k: v for k, v in css_properties1.items() if k in include_css_properties}
-                    css_properties2 = {k: v for k, v in css_properties2.items() if k in include_css_properties}
-                
-                if exclude_css_properties:
-                    css_properties1 = {k: v for k, v in css_properties1.items() if k not in exclude_css_properties}
-                    css_properties2 = {k: v for k, v in css_properties2.items() if k not in exclude_css_properties}
-                
-                if css_properties1 != css_properties2:
-                    return False
-            
-            return True
-        except Exception as e:
+            # Every check runs in the browser, which stops at the first difference
+            opts = {
+                "compare_css": compare_css,
+                "include_attributes": include_attributes or None,
+                "exclude_attributes": exclude_attributes or None,
+                "include_css_properties": include_css_properties or None,
+                "exclude_css_properties": exclude_css_properties or None,
+            }
+            return bool(self.driver.execute_script(_COMPREHENSIVE_COMPARE_JS, element1, element2, opts))
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error in comprehensive comparison: {e}")
+            self._log_error(suppress_traceback, "Error in comprehensive comparison")
             return False
 
     def is_element_visible(self, element: WebElement, suppress_traceback: bool = False, raise_exc: bool = False) -> bool:
@@ -1653,17 +1993,12 @@ class WebSession:
         try:
             if not element:
                 return False
-            # Check if the element is in the DOM by trying to access its tag name
-            element.tag_name
-            # Check if the element is visible
+            # is_displayed() raises for an element that has left the DOM, so no separate existence probe is needed
             return element.is_displayed()
-        except Exception as e:
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error checking if element is present and visible: {e}")
+            self._log_error(suppress_traceback, "Error checking if element is present and visible")
             return False
         
 
@@ -1702,13 +2037,10 @@ class WebSession:
                 )
 
             return True
-        except Exception as e:
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error setting download path: {e}")
+            self._log_error(suppress_traceback, "Error setting download path")
             return False
 
     def execute_script(self, script: str, suppress_traceback: bool = False, raise_exc: bool = False) -> None:
@@ -1725,13 +2057,10 @@ class WebSession:
         """
         try:
             self.driver.execute_script(script)
-        except Exception as e:
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error executing script: {e}")
+            self._log_error(suppress_traceback, "Error executing script")
 
     def press_key(self, key: str, suppress_traceback: bool = False, raise_exc: bool = False) -> None:
         """
@@ -1746,15 +2075,11 @@ class WebSession:
             None
         """
         try:
-            actions = ActionChains(self.driver)
-            actions.send_keys(key).perform()
-        except Exception as e:
+            self._perform_actions(lambda actions: actions.send_keys(key))
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error pressing key: {e}")
+            self._log_error(suppress_traceback, "Error pressing key")
 
     def key_down(self, key: str, suppress_traceback: bool = False, raise_exc: bool = False) -> None:
         """
@@ -1769,15 +2094,11 @@ class WebSession:
             None
         """
         try:
-            actions = ActionChains(self.driver)
-            actions.key_down(key).perform()
-        except Exception as e:
+            self._perform_actions(lambda actions: actions.key_down(key))
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error sending key down: {e}")
+            self._log_error(suppress_traceback, "Error sending key down")
 
     def key_up(self, key: str, suppress_traceback: bool = False, raise_exc: bool = False) -> None:
         """
@@ -1792,15 +2113,11 @@ class WebSession:
             None
         """
         try:
-            actions = ActionChains(self.driver)
-            actions.key_up(key).perform()
-        except Exception as e:
+            self._perform_actions(lambda actions: actions.key_up(key))
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error sending key up: {e}")
+            self._log_error(suppress_traceback, "Error sending key up")
 
     def click_key(self, key: str, suppress_traceback: bool = False, raise_exc: bool = False) -> None:
         """
@@ -1815,15 +2132,11 @@ class WebSession:
             None
         """
         try:
-            actions = ActionChains(self.driver)
-            actions.key_down(key).key_up(key).perform()
-        except Exception as e:
+            self._perform_actions(lambda actions: actions.key_down(key).key_up(key))
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error clicking key: {e}")
+            self._log_error(suppress_traceback, "Error clicking key")
 
     def click_at_coordinates(self, x: int, y: int, suppress_traceback: bool = False, raise_exc: bool = False) -> None:
         """
@@ -1839,17 +2152,13 @@ class WebSession:
             None
         """
         try:
-            actions = ActionChains(self.driver)
-            actions.move_by_offset(x, y).click().perform()
+            self._perform_actions(lambda actions: actions.move_by_offset(x, y).click())
             # Reset the mouse position to avoid offset issues in subsequent actions
-            actions.move_by_offset(-x, -y).perform()
-        except Exception as e:
+            self._perform_actions(lambda actions: actions.move_by_offset(-x, -y))
+        except Exception:
             if raise_exc:
                 raise
-            if not suppress_traceback:
-                error_traceback = format_deeper_traceback()
-                print(clean_traceback(error_traceback))
-            print(f"Error clicking at coordinates: {e}")
+            self._log_error(suppress_traceback, "Error clicking at coordinates")
 
     def get_window_size(self, suppress_traceback: bool = False, raise_exc: bool = False) -> dict:
         """
@@ -1857,6 +2166,6 @@ class WebSession:
         """
         try:
             return self.driver.get_window_size()
-        except Exception as e:
+        except Exception:
             if raise_exc:
                 raise
\ No newline at end of file